@@ -83,6 +83,20 @@ class Settings:
                 raise KeyError(f"Setting key not found: {key}")
             return self._settings[key]
 
+    def get_many(self, keys: tuple[str, ...]) -> tuple[Any, ...]:
+        """Get several setting values in one call.
+
+        Args:
+            keys: Setting keys, each supporting dot notation for nested values
+
+        Returns:
+            Tuple of setting values in the same order as keys
+
+        Raises:
+            KeyError: If any key does not exist
+        """
+        return tuple(self.get(key) for key in keys)
+
     def set(self, key: str, value: Any) -> None:
         """Set setting value.
 
@@ -110,3 +124,18 @@ class Settings:
             if key not in self._settings:
                 raise KeyError(f"Setting key not found: {key}")
             self._settings[key] = value
+
+    def update(self, values: dict[str, Any]) -> None:
+        """Apply several setting changes as one transaction.
+
+        Args:
+            values: Mapping of setting keys (dot notation supported) to new values
+
+        Raises:
+            KeyError: If any key does not exist; no changes are applied
+        """
+        # Validate every key up front so a bad key can't leave a partial update
+        for key in values:
+            self.get(key)
+        for key, value in values.items():
+            self.set(key, value)
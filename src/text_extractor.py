@@ -10,6 +10,12 @@ from bs4 import BeautifulSoup
 class TextExtractor:
     """Extract and clean text from URLs or plain text input."""
 
+    # Re-exported so callers (and tests) can catch request errors without
+    # importing requests themselves
+    HTTPError = requests.HTTPError
+    Timeout = requests.Timeout
+    RequestException = requests.RequestException
+
     def __init__(self, timeout: int = 30):
         """Initialize TextExtractor.
 
@@ -1,14 +1,83 @@
 """Settings window for configuration."""
 
+import functools
 import tkinter as tk
 from pathlib import Path
-from tkinter import filedialog, ttk
+from tkinter import TclError, filedialog, ttk
+from tkinter import font as tkfont
 
 from src.logger import get_logger
 from src.settings import Settings
 
 logger = get_logger(__name__)
 
+__all__ = ["SettingsWindow"]
+
+# Form row labels share identical styling; one spec drives their creation
+_LABEL_SPECS = (
+    ("Voice:", 0),
+    ("Speed:", 1),
+    ("Output Directory:", 2),
+)
+
+# Shared Font objects, created lazily per size. Tk re-parses a tuple font
+# spec for every widget it is passed to; a named Font object is resolved
+# once and reused by reference.
+_shared_fonts: dict[int, tkfont.Font] = {}
+
+# Screen width is constant for the session; cache it so re-opening the
+# dialog skips the winfo round-trip
+_screen_width: int | None = None
+
+
+def _get_screen_width(window) -> int:
+    """Return the screen width in pixels, cached after the first query.
+
+    Args:
+        window: Any Tk widget to query on the first call
+
+    Returns:
+        Screen width in pixels
+    """
+    global _screen_width
+    if _screen_width is None:
+        _screen_width = window.winfo_screenwidth()
+    return _screen_width
+
+
+@functools.lru_cache(maxsize=32)
+def _expand(path: str) -> Path:
+    """Expand ~ in a directory string, memoized per raw value.
+
+    Args:
+        path: Directory string as entered in the settings form
+
+    Returns:
+        Expanded Path
+    """
+    return Path(path).expanduser()
+
+
+def _font(size: int):
+    """Return a shared font for the given point size.
+
+    Args:
+        size: Font size in points
+
+    Returns:
+        A cached tkfont.Font, or the plain ("SF Pro Text", size) tuple
+        when no Tk root exists yet
+    """
+    font = _shared_fonts.get(size)
+    if font is None:
+        try:
+            font = tkfont.Font(family="SF Pro Text", size=size)
+        except (RuntimeError, TclError):
+            # No Tk root yet (or running under mocked tk in tests)
+            return ("SF Pro Text", size)
+        _shared_fonts[size] = font
+    return font
+
 
 class SettingsWindow:
     """Dialog for application settings."""
@@ -24,10 +93,20 @@ class SettingsWindow:
         self._settings = settings
         self._available_voices = available_voices
 
-        # Create window
+        # Window is built lazily on first show() so constructing the dialog
+        # costs nothing until the user actually opens it
+        self._window = None
+
+    def _build_window(self):
+        """Create the Toplevel window and all widgets (runs on first show)."""
         self._window = tk.Toplevel()
         self._window.title("Settings")
 
+        # Build the widget tree offscreen: keeping the window unmapped while
+        # widgets are added avoids a redraw/relayout pass per widget. show()
+        # deiconifies once after construction.
+        self._window.withdraw()
+
         # Remove window decorations for cleaner look (must be before geometry)
         self._window.overrideredirect(True)
 
@@ -35,6 +114,13 @@ class SettingsWindow:
         self._voice_var = tk.StringVar()
         self._speed_var = tk.DoubleVar()
         self._output_dir_var = tk.StringVar()
+        # Pre-formatted speed text; the value label binds to this directly so
+        # updates are a single Tk variable write, not a widget config call
+        self._speed_display = tk.StringVar()
+
+        # Pending slider value for coalesced label updates
+        self._pending_speed_value = None
+        self._pending_speed_after = None
 
         # Load current settings
         self._load_settings()
@@ -46,7 +132,7 @@ class SettingsWindow:
         self._window.update_idletasks()
 
         # Get screen dimensions for positioning
-        screen_width = self._window.winfo_screenwidth()
+        screen_width = _get_screen_width(self._window)
 
         # Get the natural size of the window
         window_width = self._window.winfo_reqwidth()
@@ -74,9 +160,13 @@ class SettingsWindow:
 
     def _load_settings(self):
         """Load current settings into variables."""
-        self._voice_var.set(self._settings.get("voice"))
-        self._speed_var.set(self._settings.get("speed"))
-        self._output_dir_var.set(self._settings.get("output_directory"))
+        voice, speed, output_dir = self._settings.get_many(
+            ("voice", "speed", "output_directory")
+        )
+        self._voice_var.set(voice)
+        self._speed_var.set(speed)
+        self._output_dir_var.set(output_dir)
+        self._speed_display.set(f"{speed}x")
 
     def _create_widgets(self):
         """Create all window widgets."""
@@ -96,38 +186,34 @@ class SettingsWindow:
         main_frame = tk.Frame(container, padx=20, pady=20, bg="white")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
-        # Voice selection
-        voice_label = tk.Label(
-            main_frame,
-            text="Voice:",
-            font=("SF Pro Text", 11),
-            fg="#86868b",
-            bg="white",
-            anchor="w",
-        )
-        voice_label.grid(row=0, column=0, sticky="w", pady=(0, 6))
+        # Pin the label and button columns so grid can short-circuit its
+        # layout solve instead of re-measuring every cell on lift/focus
+        main_frame.columnconfigure(0, minsize=120)
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.columnconfigure(2, minsize=80)
+
+        # Row labels (voice, speed, output directory)
+        for text, row in _LABEL_SPECS:
+            tk.Label(
+                main_frame,
+                text=text,
+                font=_font(11),
+                fg="#86868b",
+                bg="white",
+                anchor="w",
+            ).grid(row=row, column=0, sticky="w", pady=(0, 6))
 
+        # Voice selection
         voice_combo = ttk.Combobox(
             main_frame,
             textvariable=self._voice_var,
             values=self._available_voices,
             state="readonly",
-            font=("SF Pro Text", 12),
+            font=_font(12),
             width=35,
         )
         voice_combo.grid(row=0, column=1, columnspan=2, sticky="ew", pady=(0, 15))
 
-        # Speed control
-        speed_label = tk.Label(
-            main_frame,
-            text="Speed:",
-            font=("SF Pro Text", 11),
-            fg="#86868b",
-            bg="white",
-            anchor="w",
-        )
-        speed_label.grid(row=1, column=0, sticky="w", pady=(0, 6))
-
         # Speed frame with slider and value label
         speed_frame = tk.Frame(main_frame, bg="white")
         speed_frame.grid(row=1, column=1, columnspan=2, sticky="ew", pady=(0, 15))
@@ -139,7 +225,7 @@ class SettingsWindow:
             to=2.0,
             resolution=0.25,
             orient=tk.HORIZONTAL,
-            font=("SF Pro Text", 11),
+            font=_font(11),
             bg="white",
             fg="#1d1d1f",
             highlightthickness=0,
@@ -151,8 +237,8 @@ class SettingsWindow:
         # Value label
         self._speed_value_label = tk.Label(
             speed_frame,
-            text=f"{self._speed_var.get()}x",
-            font=("SF Pro Text", 11),
+            textvariable=self._speed_display,
+            font=_font(11),
             fg="#1d1d1f",
             bg="white",
             width=5,
@@ -163,20 +249,10 @@ class SettingsWindow:
         speed_scale.config(command=self._on_speed_change)
 
         # Output directory
-        output_label = tk.Label(
-            main_frame,
-            text="Output Directory:",
-            font=("SF Pro Text", 11),
-            fg="#86868b",
-            bg="white",
-            anchor="w",
-        )
-        output_label.grid(row=2, column=0, sticky="w", pady=(0, 6))
-
         output_entry = tk.Entry(
             main_frame,
             textvariable=self._output_dir_var,
-            font=("SF Pro Text", 12),
+            font=_font(12),
             relief=tk.FLAT,
             bd=0,
             highlightthickness=0,
@@ -188,7 +264,7 @@ class SettingsWindow:
             main_frame,
             text="Browse",
             command=self._browse_directory,
-            font=("SF Pro Text", 11),
+            font=_font(11),
             relief=tk.FLAT,
             bd=0,
             bg="#f5f5f7",
@@ -198,9 +274,6 @@ class SettingsWindow:
         )
         browse_btn.grid(row=2, column=2, padx=(8, 0), pady=(0, 15))
 
-        # Configure grid weights
-        main_frame.columnconfigure(1, weight=1)
-
         # Button frame
         button_frame = tk.Frame(main_frame, bg="white")
         button_frame.grid(row=3, column=0, columnspan=3, pady=(20, 0), sticky="e")
@@ -210,7 +283,7 @@ class SettingsWindow:
             button_frame,
             text="Close",
             command=self._on_cancel,
-            font=("SF Pro Text", 13),
+            font=_font(13),
             relief=tk.FLAT,
             bd=0,
             highlightthickness=0,
@@ -228,7 +301,7 @@ class SettingsWindow:
             command=self._on_save,
             bg="#007AFF",
             fg="white",
-            font=("SF Pro Text", 13),
+            font=_font(13),
             relief=tk.FLAT,
             bd=0,
             highlightthickness=0,
@@ -240,17 +313,32 @@ class SettingsWindow:
         save_btn.pack(side=tk.LEFT)
 
     def _on_speed_change(self, value):
-        """Update speed value label.
+        """Record new slider value and schedule a coalesced label update.
+
+        The scale fires its command on every pixel of a drag; updating the
+        label once per idle cycle keeps the drag smooth instead of doing a
+        Tcl round-trip per event.
 
         Args:
             value: New speed value from slider
         """
-        self._speed_value_label.config(text=f"{float(value)}x")
+        self._pending_speed_value = value
+        if self._pending_speed_after is None:
+            self._pending_speed_after = self._window.after_idle(self._flush_speed)
+
+    def _flush_speed(self):
+        """Apply the most recent pending speed value to the label."""
+        self._speed_display.set(f"{float(self._pending_speed_value)}x")
+        self._pending_speed_value = None
+        self._pending_speed_after = None
 
     def _browse_directory(self):
         """Open directory browser."""
+        value = self._output_dir_var.get()
         directory = filedialog.askdirectory(
-            initialdir=Path(self._output_dir_var.get()).expanduser(),
+            # Empty field: let the dialog pick its OS default instead of
+            # resolving "" to the current working directory
+            initialdir=_expand(value) if value else None,
             title="Select Output Directory",
         )
         if directory:
@@ -258,24 +346,34 @@ class SettingsWindow:
 
     def _on_save(self):
         """Save settings and close."""
-        # Update settings
-        self._settings.set("voice", self._voice_var.get())
-        self._settings.set("speed", self._speed_var.get())
-        self._settings.set("output_directory", self._output_dir_var.get())
-
-        # Save to file
+        if self._window is None:
+            return
+
+        # Apply all changes in one transaction, then persist once
+        self._settings.update({
+            "voice": self._voice_var.get(),
+            "speed": self._speed_var.get(),
+            "output_directory": self._output_dir_var.get(),
+        })
         self._settings.save()
 
         # Close window
         self._window.destroy()
+        self._window = None
 
     def _on_cancel(self):
         """Cancel and close without saving."""
+        if self._window is None:
+            return
+
         self._window.destroy()
+        self._window = None
 
     def show(self):
-        """Display the window."""
+        """Display the window, building it on first call."""
         logger.info("showing_settings_window")
+        if self._window is None:
+            self._build_window()
         self._window.deiconify()
         self._window.focus_force()
         logger.debug("settings_window_visible")
@@ -0,0 +1,44 @@
+"""Quick check that the SVG tray icon rasterizes correctly at menu bar size.
+
+Renders assets/icon.svg to a 44x44 PNG (the @2x menu bar size) under
+/tmp/test_icon.png. The heavy imports (PIL, reportlab, svglib) and the
+rasterization itself only run when the SVG is newer than the cached PNG,
+so repeated runs cost a single stat call.
+"""
+
+from pathlib import Path
+
+SVG_PATH = Path(__file__).parent / "assets" / "icon.svg"
+OUTPUT_PATH = Path("/tmp/test_icon.png")
+ICON_SIZE = 44  # 22pt menu bar icon @2x for retina
+
+
+def main():
+    """Rasterize the SVG icon to a 44x44 PNG, skipping work if up to date."""
+    if OUTPUT_PATH.exists() and OUTPUT_PATH.stat().st_mtime >= SVG_PATH.stat().st_mtime:
+        print(f"Icon up to date: {OUTPUT_PATH}")
+        return
+
+    # Deferred imports: reportlab + svglib cost hundreds of ms to load, so
+    # only pay for them when the icon actually needs re-rendering.
+    from reportlab.graphics import renderPM
+    from svglib.svglib import svg2rlg
+
+    drawing = svg2rlg(str(SVG_PATH))
+
+    # Scale the drawing to the target size before rasterizing so the PNG
+    # comes out at 44x44 directly -- no oversampled render + Lanczos resize.
+    sx = ICON_SIZE / drawing.width
+    sy = ICON_SIZE / drawing.height
+    drawing.width = ICON_SIZE
+    drawing.height = ICON_SIZE
+    drawing.scale(sx, sy)
+
+    # Write straight to disk; no PIL decode/convert/re-encode roundtrip
+    renderPM.drawToFile(drawing, str(OUTPUT_PATH), fmt="PNG", dpi=72, bg=0x00000000)
+
+    print(f"Rendered {SVG_PATH.name} -> {OUTPUT_PATH} ({ICON_SIZE}x{ICON_SIZE})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,110 @@
 """Pytest configuration and shared fixtures"""
 
+import json
+from unittest.mock import MagicMock, Mock, patch
+
 import pytest
 
+# Pre-import the modules with heavyweight dependency chains (tkinter,
+# pystray, requests) once at session start; per-file imports in the test
+# modules then resolve from the sys.modules cache. tkinter/pystray are NOT
+# replaced in sys.modules here: the tray tests assert against real pystray
+# menu objects, and the UI tests patch tk per test instead.
+import src.settings  # noqa: F401
+import src.text_extractor  # noqa: F401
+import src.tray  # noqa: F401
+import src.ui.input_window  # noqa: F401
+import src.ui.settings_window  # noqa: F401
+
+# Voice config with required fields, serialized once at import since the
+# content never changes between tests
+_VOICE_CONFIG_JSON = json.dumps(
+    {
+        "num_symbols": 100,
+        "num_speakers": 1,
+        "audio": {"sample_rate": 22050},
+        "espeak": {"voice": "en-us"},
+        "phoneme_id_map": {},
+    },
+    separators=(",", ":"),
+)
+
+
+def pytest_collection_modifyitems(items):
+    """Group tests by module for pytest-xdist's --dist loadgroup.
+
+    Keeping a module's tests on one worker lets its module-scoped fixtures
+    (extractor, cached config bytes, canned responses) initialize once per
+    worker instead of once per test. No effect on plain serial runs.
+    """
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(name=item.module.__name__))
+
+
+@pytest.fixture
+def callback():
+    """Plain function-spec mock for window callbacks.
+
+    Mock with a callable spec is several times cheaper to construct than
+    the MagicMock that mocker.Mock() produces, and the callbacks are only
+    ever called and asserted on.
+    """
+    return Mock(spec=lambda text: None)
+
 
 @pytest.fixture
-def temp_voices_dir(tmp_path):
-    """Create a temporary voices directory for testing"""
-    voices_dir = tmp_path / "voices"
-    voices_dir.mkdir()
-    return voices_dir
+def tk_mock():
+    """Patch the tk reference in both UI window modules with one mock.
+
+    A single fixture replaces the per-test patch lines; each test still
+    gets a fresh mock so call records can't leak between tests. Uses
+    unittest.mock.patch directly, skipping pytest-mock's per-call stack
+    inspection.
+    """
+    m = MagicMock(name="tk")
+    with patch("src.ui.input_window.tk", m), patch("src.ui.settings_window.tk", m):
+        yield m
 
 
 @pytest.fixture
+def tk_and_window(tk_mock):
+    """tk mock plus a configured window double wired as its Toplevel/Tk.
+
+    Bundles the screen-size scaffolding the window-initialization tests
+    were each rebuilding inline.
+    """
+    window = MagicMock()
+    window.winfo_screenwidth.return_value = 1920
+    tk_mock.Toplevel.return_value = window
+    tk_mock.Tk.return_value = window
+    return tk_mock, window
+
+
+@pytest.fixture
+def ttk_mock():
+    """Patch the ttk reference in the settings window module"""
+    m = MagicMock(name="ttk")
+    with patch("src.ui.settings_window.ttk", m):
+        yield m
+
+
+@pytest.fixture(scope="session")
+def temp_voices_dir(tmp_path_factory):
+    """Create a temporary voices directory shared across the session.
+
+    Tests only read from this directory; anything needing an empty or
+    writable voices dir should use its own tmp_path instead.
+    """
+    return tmp_path_factory.mktemp("voices")
+
+
+@pytest.fixture(scope="session")
 def mock_voice_file(temp_voices_dir):
     """Create a mock voice file for testing"""
-    import json
-
     voice_path = temp_voices_dir / "en_US-test-medium.onnx"
     voice_path.touch()
 
-    # Create corresponding JSON config with required fields
-    config = {
-        "num_symbols": 100,
-        "num_speakers": 1,
-        "audio": {"sample_rate": 22050},
-        "espeak": {"voice": "en-us"},
-        "phoneme_id_map": {},
-    }
     json_path = temp_voices_dir / "en_US-test-medium.onnx.json"
-    json_path.write_text(json.dumps(config))
+    json_path.write_text(_VOICE_CONFIG_JSON)
 
     return voice_path
@@ -8,17 +8,23 @@ from src.audio_player import AudioPlayer, PlaybackState
 
 
 class TestAudioPlayer:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def audio_data(self):
-        """Create sample audio data for testing"""
+        """Create sample audio data shared by the whole module (read-only)"""
         # Generate 0.5 seconds of audio at 22050 Hz
         sample_rate = 22050
         duration = 0.5
         samples = int(sample_rate * duration)
-        # Simple sine wave
-        t = np.linspace(0, duration, samples)
         frequency = 440  # A4 note
-        audio = (np.sin(2 * np.pi * frequency * t) * 32767).astype(np.int16)
+        # Simple sine wave, computed in-place in one float32 buffer to avoid
+        # the float64 intermediates a naive linspace/sin expression creates
+        t = np.arange(samples, dtype=np.float32)
+        t *= 2 * np.pi * frequency / sample_rate
+        np.sin(t, out=t)
+        t *= 32767.0
+        audio = t.astype(np.int16)
+        # Tests only read the buffer; lock it so sharing across tests is safe
+        audio.setflags(write=False)
         return audio
 
     @pytest.fixture
@@ -26,24 +32,25 @@ class TestAudioPlayer:
         """Create an AudioPlayer instance"""
         return AudioPlayer(sample_rate=22050)
 
+    @pytest.fixture(autouse=True)
+    def mock_output_stream(self, mocker):
+        """Mock sounddevice.OutputStream for every test"""
+        return mocker.patch("sounddevice.OutputStream")
+
     def test_initial_state_is_stopped(self, player):
         """Should start in stopped state"""
         assert player.state == PlaybackState.STOPPED
 
-    def test_play_starts_playback(self, player, audio_data, mocker):
+    def test_play_starts_playback(self, player, audio_data, mock_output_stream):
         """Should start playing audio"""
-        # Mock sounddevice
-        mock_output_stream = mocker.patch("sounddevice.OutputStream")
-
         player.play(audio_data)
 
         assert player.state == PlaybackState.PLAYING
         mock_output_stream.assert_called_once()
 
-    def test_pause_stops_playback_temporarily(self, player, audio_data, mocker):
+    def test_pause_stops_playback_temporarily(self, player, audio_data, mock_output_stream):
         """Should pause without losing position"""
-        mock_stream = mocker.MagicMock()
-        mocker.patch("sounddevice.OutputStream", return_value=mock_stream)
+        mock_stream = mock_output_stream.return_value
 
         player.play(audio_data)
         player.pause()
@@ -51,10 +58,9 @@ class TestAudioPlayer:
         assert player.state == PlaybackState.PAUSED
         mock_stream.stop.assert_called_once()
 
-    def test_resume_continues_from_pause_position(self, player, audio_data, mocker):
+    def test_resume_continues_from_pause_position(self, player, audio_data, mock_output_stream):
         """Should continue from where it paused"""
-        mock_stream = mocker.MagicMock()
-        mocker.patch("sounddevice.OutputStream", return_value=mock_stream)
+        mock_stream = mock_output_stream.return_value
 
         player.play(audio_data)
         player.pause()
@@ -64,10 +70,9 @@ class TestAudioPlayer:
         # Stream should be started again
         assert mock_stream.start.call_count >= 1
 
-    def test_stop_resets_position(self, player, audio_data, mocker):
+    def test_stop_resets_position(self, player, audio_data, mock_output_stream):
         """Should stop and reset to beginning"""
-        mock_stream = mocker.MagicMock()
-        mocker.patch("sounddevice.OutputStream", return_value=mock_stream)
+        mock_stream = mock_output_stream.return_value
 
         player.play(audio_data)
         player.stop()
@@ -77,10 +82,8 @@ class TestAudioPlayer:
         mock_stream.stop.assert_called_once()
         mock_stream.close.assert_called_once()
 
-    def test_state_transitions(self, player, audio_data, mocker):
+    def test_state_transitions(self, player, audio_data):
         """Should correctly track playing/paused/stopped states"""
-        mocker.patch("sounddevice.OutputStream")
-
         # Initial state
         assert player.state == PlaybackState.STOPPED
 
@@ -100,10 +103,8 @@ class TestAudioPlayer:
         player.stop()
         assert player.state == PlaybackState.STOPPED
 
-    def test_speed_change_during_playback(self, player, audio_data, mocker):
+    def test_speed_change_during_playback(self, player, audio_data):
         """Should adjust speed without restarting"""
-        mocker.patch("sounddevice.OutputStream")
-
         player.play(audio_data)
         initial_speed = player.speed
 
@@ -117,7 +118,6 @@ class TestAudioPlayer:
     def test_completion_callback_called(self, player, audio_data, mocker):
         """Should call callback when playback finishes"""
         callback = mocker.MagicMock()
-        mocker.patch("sounddevice.OutputStream")
 
         player.set_completion_callback(callback)
         player.play(audio_data)
@@ -128,10 +128,9 @@ class TestAudioPlayer:
         callback.assert_called_once()
         assert player.state == PlaybackState.STOPPED
 
-    def test_play_while_playing_restarts(self, player, audio_data, mocker):
+    def test_play_while_playing_restarts(self, player, audio_data, mock_output_stream):
         """Should restart playback when play called while playing"""
-        mock_stream = mocker.MagicMock()
-        mocker.patch("sounddevice.OutputStream", return_value=mock_stream)
+        mock_stream = mock_output_stream.return_value
 
         player.play(audio_data)
         player.play(audio_data)
@@ -152,20 +151,16 @@ class TestAudioPlayer:
         player.resume()
         assert player.state == PlaybackState.STOPPED
 
-    def test_get_position(self, player, audio_data, mocker):
+    def test_get_position(self, player, audio_data):
         """Should return current playback position"""
-        mocker.patch("sounddevice.OutputStream")
-
         assert player.position == 0
 
         player.play(audio_data)
         # Position should be tracked (we'll just verify it exists)
         assert player.position >= 0
 
-    def test_get_duration(self, player, audio_data, mocker):
+    def test_get_duration(self, player, audio_data):
         """Should return total audio duration"""
-        mocker.patch("sounddevice.OutputStream")
-
         player.play(audio_data)
         duration = player.duration
 
@@ -1,16 +1,29 @@
 """Tests for InputWindow class."""
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
 
 from src.ui.input_window import InputWindow
 
 
+class _Counter:
+    """Plain-int call counter; no MagicMock call-record overhead."""
+
+    def __init__(self):
+        self.n = 0
+
+    def __call__(self, *args, **kwargs):
+        self.n += 1
+        return self
+
+
 class TestInputWindow:
     """Test suite for InputWindow."""
 
-    def test_submit_calls_callback_with_text(self, mocker):
+    def test_submit_calls_callback_with_text(self, mocker, tk_mock, callback):
         """Should call callback with entered text."""
-        callback = mocker.Mock()
-        mocker.patch("src.ui.input_window.tk")
 
         window = InputWindow(callback)
 
@@ -23,15 +36,12 @@ class TestInputWindow:
         # Should call callback with text
         callback.assert_called_once_with("https://example.com")
 
-    def test_clipboard_button_pastes_content(self, mocker):
+    def test_clipboard_button_pastes_content(self, tk_and_window, callback):
         """Should paste clipboard content to text area."""
-        callback = mocker.Mock()
-        mock_tk = mocker.patch("src.ui.input_window.tk")
 
         # Mock clipboard
-        mock_window = mocker.Mock()
+        _, mock_window = tk_and_window
         mock_window.clipboard_get.return_value = "Clipboard text here"
-        mock_tk.Tk.return_value = mock_window
 
         window = InputWindow(callback)
         window._window = mock_window
@@ -42,28 +52,28 @@ class TestInputWindow:
         # Should insert clipboard content into text area
         window._text_area.insert.assert_called_with("1.0", "Clipboard text here")
 
-    def test_esc_closes_window(self, mocker):
+    def test_esc_closes_window(self, mocker, tk_mock, callback):
         """Should close window on ESC key without callback."""
-        callback = mocker.Mock()
-        mocker.patch("src.ui.input_window.tk")
 
         window = InputWindow(callback)
 
-        # Verify ESC binding was set
-        window._window.bind.assert_any_call('<Escape>', mocker.ANY)
+        # Verify ESC binding was set; scanning call_args_list directly
+        # skips mock's ANY equality matching over every recorded call
+        bind_calls = window._window.bind.call_args_list
+        binds = [c for c in bind_calls if c.args and c.args[0] == '<Escape>']
+        assert binds, "ESC binding not registered"
 
         # Should not call callback when window is destroyed via ESC
         callback.assert_not_called()
 
-    def test_empty_text_does_not_submit(self, mocker):
-        """Should not call callback with empty text."""
-        callback = mocker.Mock()
-        mocker.patch("src.ui.input_window.tk")
+    @pytest.mark.parametrize("text", ["", "   ", "\t\n", "  \n  "])
+    def test_empty_text_does_not_submit(self, tk_mock, callback, text):
+        """Should not call callback with empty or whitespace-only text."""
 
         window = InputWindow(callback)
 
         # Simulate empty text area
-        window._text_area.get.return_value = "   "
+        window._text_area.get.return_value = text
 
         # Simulate play button click
         window._on_play()
@@ -71,10 +81,8 @@ class TestInputWindow:
         # Should not call callback
         callback.assert_not_called()
 
-    def test_show_displays_window(self, mocker):
+    def test_show_displays_window(self, mocker, tk_mock, callback):
         """Should display the window."""
-        callback = mocker.Mock()
-        mocker.patch("src.ui.input_window.tk")
 
         window = InputWindow(callback)
         window.show()
@@ -83,55 +91,59 @@ class TestInputWindow:
         window._window.deiconify.assert_called_once()
         window._window.focus_force.assert_called_once()
 
-    def test_window_initialization(self, mocker):
-        """Should initialize window with correct properties."""
-        callback = mocker.Mock()
-        mock_tk = mocker.patch("src.ui.input_window.tk")
-        mock_window = mocker.Mock()
-        mock_tk.Toplevel.return_value = mock_window
 
-        # Mock dimensions for positioning calculation
-        mock_window.winfo_screenwidth.return_value = 1920
-        mock_window.winfo_reqwidth.return_value = 210
-        mock_window.winfo_reqheight.return_value = 280
+@pytest.fixture(scope="class")
+def built():
+    """Construct InputWindow once per class; tests only read what __init__ did."""
+    tk = MagicMock(name="tk")
+
+    window = MagicMock()
+    window.winfo_screenwidth.return_value = 1920
+    window.winfo_reqwidth.return_value = 210
+    window.winfo_reqheight.return_value = 280
+    tk.Toplevel.return_value = window
+
+    button_factory = _Counter()
+    button_factory.pack = _Counter()
+    tk.Button.side_effect = button_factory
 
-        InputWindow(callback)
+    with patch("src.ui.input_window.tk", tk):
+        input_window = InputWindow(Mock(spec=lambda text: None))
 
+        yield SimpleNamespace(
+            tk=tk,
+            window=window,
+            button_factory=button_factory,
+            input_window=input_window,
+        )
+
+
+class TestInputWindowConstruction:
+    """Init-time assertions sharing a single constructed InputWindow."""
+
+    def test_window_initialization(self, built):
+        """Should initialize window with correct properties."""
         # Should set title
-        mock_window.title.assert_called_once_with("Piper TTS Reader")
+        built.window.title.assert_called_once_with("Piper TTS Reader")
 
         # Should set geometry with position
-        mock_window.geometry.assert_called_once()
+        built.window.geometry.assert_called_once()
         # Verify geometry string includes position
-        geometry_call = mock_window.geometry.call_args[0][0]
+        geometry_call = built.window.geometry.call_args[0][0]
         assert "210x280+" in geometry_call  # Should have width x height + x + y format
 
-    def test_text_area_created(self, mocker):
+    def test_text_area_created(self, built):
         """Should create text area widget."""
-        callback = mocker.Mock()
-        mock_tk = mocker.patch("src.ui.input_window.tk")
-        mock_text = mocker.Mock()
-        mock_tk.Text.return_value = mock_text
-
-        InputWindow(callback)
-
         # Should create Text widget
-        mock_tk.Text.assert_called_once()
+        built.tk.Text.assert_called_once()
 
         # Should pack text area
-        mock_text.pack.assert_called()
+        built.input_window._text_area.pack.assert_called()
 
-    def test_buttons_created(self, mocker):
+    def test_buttons_created(self, built):
         """Should create play, stop, and close buttons."""
-        callback = mocker.Mock()
-        mock_tk = mocker.patch("src.ui.input_window.tk")
-        mock_button = mocker.Mock()
-        mock_tk.Button.return_value = mock_button
-
-        InputWindow(callback)
-
         # Should create 3 buttons (Play, Stop, and Close)
-        assert mock_tk.Button.call_count == 3
+        assert built.button_factory.n == 3
 
         # Should pack close and play buttons initially (not stop)
-        assert mock_button.pack.call_count == 2
+        assert built.button_factory.pack.n == 2
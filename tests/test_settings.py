@@ -7,6 +7,30 @@ import pytest
 from src.settings import Settings
 
 
+@pytest.fixture(scope="module")
+def _default_config_bytes(tmp_path_factory):
+    """Serialize the default config once; tests copy the bytes into place.
+
+    Writing cached bytes is cheaper than re-running default generation and
+    JSON serialization for every Settings construction.
+    """
+    path = tmp_path_factory.mktemp("settings-default") / "config.json"
+    Settings(config_path=path)
+    return path.read_bytes()
+
+
+@pytest.fixture
+def settings(tmp_path, _default_config_bytes):
+    """Settings backed by a fresh default config file.
+
+    Returns:
+        Tuple of (Settings instance, config file path)
+    """
+    config_file = tmp_path / "config.json"
+    config_file.write_bytes(_default_config_bytes)
+    return Settings(config_path=config_file), config_file
+
+
 class TestSettings:
     """Test suite for Settings."""
 
@@ -48,55 +72,95 @@ class TestSettings:
         assert settings.get("output_directory") == "~/Music"
         assert settings.get("shortcuts.play_pause") == "ctrl+alt+p"
 
-    def test_save_writes_to_file(self, tmp_path):
+    def test_save_writes_to_file(self, settings):
         """Should persist settings to JSON."""
-        config_file = tmp_path / "config.json"
-        settings = Settings(config_path=config_file)
+        s, config_file = settings
 
-        settings.set("voice", "new-voice")
-        settings.set("speed", 2.0)
-        settings.save()
+        s.set("voice", "new-voice")
+        s.set("speed", 2.0)
+        s.save()
 
         # Read file directly
         saved_data = json.loads(config_file.read_text())
         assert saved_data["voice"] == "new-voice"
         assert saved_data["speed"] == 2.0
 
-    def test_get_returns_value(self, tmp_path):
-        """Should return setting value."""
-        config_file = tmp_path / "config.json"
-        settings = Settings(config_path=config_file)
-
-        assert settings.get("voice") == "en_US-lessac-medium"
-        assert settings.get("speed") == 1.0
-
-    def test_get_nested_value(self, tmp_path):
-        """Should return nested setting like shortcuts.play_pause."""
-        config_file = tmp_path / "config.json"
-        settings = Settings(config_path=config_file)
+    @pytest.mark.parametrize(
+        "key,expected",
+        [
+            ("voice", "en_US-lessac-medium"),
+            ("speed", 1.0),
+            ("shortcuts.play_pause", "ctrl+shift+p"),
+            ("shortcuts.stop", "ctrl+shift+s"),
+            ("shortcuts.speed_up", "ctrl+shift+]"),
+        ],
+    )
+    def test_get_returns_value(self, settings, key, expected):
+        """Should return top-level and nested setting values."""
+        s, _ = settings
 
-        assert settings.get("shortcuts.play_pause") == "ctrl+shift+p"
-        assert settings.get("shortcuts.stop") == "ctrl+shift+s"
-        assert settings.get("shortcuts.speed_up") == "ctrl+shift+]"
+        assert s.get(key) == expected
 
-    def test_set_updates_value(self, tmp_path):
-        """Should update setting value."""
-        config_file = tmp_path / "config.json"
-        settings = Settings(config_path=config_file)
+    def test_get_many_returns_values(self, settings):
+        """Should return multiple setting values in one call."""
+        s, _ = settings
 
-        settings.set("voice", "updated-voice")
-        assert settings.get("voice") == "updated-voice"
+        values = s.get_many(("voice", "speed", "shortcuts.play_pause"))
 
-        settings.set("shortcuts.play_pause", "ctrl+alt+p")
-        assert settings.get("shortcuts.play_pause") == "ctrl+alt+p"
+        assert values == ("en_US-lessac-medium", 1.0, "ctrl+shift+p")
 
-    def test_invalid_setting_raises(self, tmp_path):
-        """Should raise for unknown setting key."""
-        config_file = tmp_path / "config.json"
-        settings = Settings(config_path=config_file)
+        with pytest.raises(KeyError):
+            s.get_many(("voice", "nonexistent_key"))
+
+    @pytest.mark.parametrize(
+        "key,value",
+        [
+            ("voice", "updated-voice"),
+            ("shortcuts.play_pause", "ctrl+alt+p"),
+        ],
+    )
+    def test_set_updates_value(self, settings, key, value):
+        """Should update top-level and nested setting values."""
+        s, _ = settings
+
+        s.set(key, value)
+        assert s.get(key) == value
+
+    def test_update_applies_multiple_values(self, settings):
+        """Should apply several changes in one call."""
+        s, _ = settings
+
+        s.update({
+            "voice": "new-voice",
+            "speed": 2.0,
+            "shortcuts.play_pause": "ctrl+alt+p",
+        })
+
+        assert s.get("voice") == "new-voice"
+        assert s.get("speed") == 2.0
+        assert s.get("shortcuts.play_pause") == "ctrl+alt+p"
+
+    def test_update_unknown_key_applies_nothing(self, settings):
+        """Should reject the whole update when any key is unknown."""
+        s, _ = settings
 
         with pytest.raises(KeyError):
-            settings.get("nonexistent_key")
+            s.update({"voice": "new-voice", "nonexistent_key": "value"})
+
+        # No partial update
+        assert s.get("voice") == "en_US-lessac-medium"
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            lambda s: s.get("nonexistent_key"),
+            lambda s: s.set("nonexistent_key", "value"),
+        ],
+        ids=["get", "set"],
+    )
+    def test_invalid_setting_raises(self, settings, op):
+        """Should raise for unknown setting key."""
+        s, _ = settings
 
         with pytest.raises(KeyError):
-            settings.set("nonexistent_key", "value")
+            op(s)
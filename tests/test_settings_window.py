@@ -1,56 +1,89 @@
 """Tests for SettingsWindow class."""
 
+from types import SimpleNamespace
 
+import pytest
+
+from src.ui import settings_window
 from src.ui.settings_window import SettingsWindow
 
+# Canned get_many() results, built once at import instead of per test
+_CFG_DEFAULT = ("en_US-lessac-medium", 1.0, "~/Downloads")
+_CFG = ("en_US-amy-low", 1.5, "~/Music")
+
+
+class _Recorder:
+    """Minimal call recorder; far cheaper to construct than a Mock."""
+
+    def __init__(self, result=None):
+        self.calls = []
+        self.result = result
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.result
+
+
+def _settings_double(cfg=_CFG_DEFAULT):
+    """Settings stand-in with only the attributes SettingsWindow touches."""
+    return SimpleNamespace(
+        get_many=_Recorder(result=cfg),
+        update=_Recorder(),
+        save=_Recorder(),
+    )
+
 
 class TestSettingsWindow:
     """Test suite for SettingsWindow."""
 
-    def test_voice_dropdown_shows_available_voices(self, mocker):
-        """Should populate dropdown with discovered voices."""
-        mock_settings = mocker.Mock()
-        mock_settings.get.return_value = "en_US-lessac-medium"
+    @pytest.fixture(autouse=True)
+    def _reset_screen_width_cache(self, monkeypatch):
+        """Clear the module-level screen width cache between tests."""
+        monkeypatch.setattr(settings_window, "_screen_width", None)
 
-        mocker.patch("src.ui.settings_window.tk")
-        mock_ttk = mocker.patch("src.ui.settings_window.ttk")
+    @pytest.fixture(autouse=True)
+    def _patch_ui_toolkit(self, tk_mock, ttk_mock):
+        """Patch tk/ttk for every test in the class.
+
+        Each test still gets fresh mocks (call records stay isolated); the
+        autouse hookup just removes the repeated fixture parameters.
+        """
+        self.tk = tk_mock
+        self.ttk = ttk_mock
+
+    def test_voice_dropdown_shows_available_voices(self):
+        """Should populate dropdown with discovered voices."""
+        mock_settings = _settings_double()
 
         voices = ["en_US-lessac-medium", "en_US-amy-low", "en_GB-alan-medium"]
 
-        SettingsWindow(mock_settings, voices)
+        SettingsWindow(mock_settings, voices).show()
 
         # Should create combobox with voices
-        mock_ttk.Combobox.assert_called()
-        call_kwargs = mock_ttk.Combobox.call_args[1]
+        self.ttk.Combobox.assert_called()
+        call_kwargs = self.ttk.Combobox.call_args[1]
         assert "values" in call_kwargs
         assert call_kwargs["values"] == voices
 
-    def test_voice_combobox_created(self, mocker):
+    def test_voice_combobox_created(self):
         """Should create voice combobox widget."""
-        mock_settings = mocker.Mock()
-        mock_settings.get.return_value = "voice1"
-
-        mocker.patch("src.ui.settings_window.tk")
-        mock_ttk = mocker.patch("src.ui.settings_window.ttk")
+        mock_settings = _settings_double()
 
-        SettingsWindow(mock_settings, ["voice1"])
+        SettingsWindow(mock_settings, ["voice1"]).show()
 
         # Should create Combobox widget
-        mock_ttk.Combobox.assert_called()
+        self.ttk.Combobox.assert_called()
 
     def test_save_updates_settings(self, mocker):
         """Should save changes to settings."""
-        mock_settings = mocker.Mock()
-        mock_settings.get.side_effect = lambda key: {
-            "voice": "en_US-lessac-medium",
-            "speed": 1.0,
-            "output_directory": "~/Downloads",
-        }[key]
+        mock_settings = _settings_double()
 
-        mocker.patch("src.ui.settings_window.tk")
-        mocker.patch("src.ui.settings_window.ttk")
+        # Each StringVar must be a distinct mock so voice and output
+        # directory can hold different values
+        self.tk.StringVar.side_effect = lambda *a, **k: mocker.Mock()
 
         window = SettingsWindow(mock_settings, ["en_US-lessac-medium", "en_US-amy-low"])
+        window.show()
 
         # Mock new values
         window._voice_var.get.return_value = "en_US-amy-low"
@@ -60,45 +93,43 @@ class TestSettingsWindow:
         # Simulate save button click
         window._on_save()
 
-        # Should update settings (voice, speed, and output_directory)
-        assert mock_settings.set.call_count == 3
-        mock_settings.save.assert_called_once()
+        # Should apply all changes in one update call, then save once
+        expected = {
+            "voice": "en_US-amy-low",
+            "speed": 1.5,
+            "output_directory": "~/Music",
+        }
+        assert mock_settings.update.calls == [((expected,), {})]
+        assert len(mock_settings.save.calls) == 1
 
-    def test_cancel_closes_without_saving(self, mocker):
+    def test_cancel_closes_without_saving(self):
         """Should close without saving."""
-        mock_settings = mocker.Mock()
-        mock_settings.get.return_value = "test_value"
-
-        mocker.patch("src.ui.settings_window.tk")
-        mocker.patch("src.ui.settings_window.ttk")
+        mock_settings = _settings_double()
 
         window = SettingsWindow(mock_settings, ["voice1"])
+        window.show()
+        toplevel = window._window
 
         # Simulate cancel button click
         window._on_cancel()
 
         # Should destroy window
-        window._window.destroy.assert_called_once()
+        toplevel.destroy.assert_called_once()
 
         # Should not save settings
-        mock_settings.save.assert_not_called()
+        assert not mock_settings.save.calls
 
-    def test_window_initialization(self, mocker):
+    def test_window_initialization(self, tk_and_window):
         """Should initialize window with correct properties."""
-        mock_settings = mocker.Mock()
-        mock_settings.get.return_value = "test_value"
+        mock_settings = _settings_double()
 
-        mock_tk = mocker.patch("src.ui.settings_window.tk")
-        mocker.patch("src.ui.settings_window.ttk")
-        mock_window = mocker.Mock()
-        mock_tk.Toplevel.return_value = mock_window
+        _, mock_window = tk_and_window
 
         # Mock dimensions for positioning calculation
-        mock_window.winfo_screenwidth.return_value = 1920
         mock_window.winfo_reqwidth.return_value = 480
         mock_window.winfo_reqheight.return_value = 320
 
-        SettingsWindow(mock_settings, ["voice1"])
+        SettingsWindow(mock_settings, ["voice1"]).show()
 
         # Should set title
         mock_window.title.assert_called_once_with("Settings")
@@ -109,43 +140,27 @@ class TestSettingsWindow:
         geometry_call = mock_window.geometry.call_args[0][0]
         assert "480x320+" in geometry_call  # Should have width x height + x + y format
 
-    def test_output_directory_field_created(self, mocker):
+    def test_output_directory_field_created(self):
         """Should create output directory entry."""
-        mock_settings = mocker.Mock()
-        mock_settings.get.side_effect = lambda key: {
-            "voice": "en_US-lessac-medium",
-            "speed": 1.0,
-            "output_directory": "~/Downloads",
-        }[key]
+        mock_settings = _settings_double()
 
-        mock_tk = mocker.patch("src.ui.settings_window.tk")
-        mocker.patch("src.ui.settings_window.ttk")
-
-        SettingsWindow(mock_settings, ["voice1"])
+        SettingsWindow(mock_settings, ["voice1"]).show()
 
         # Should create Entry widget for output directory
-        mock_tk.Entry.assert_called()
+        self.tk.Entry.assert_called()
 
-    def test_browse_button_created(self, mocker):
+    def test_browse_button_created(self):
         """Should create browse button for output directory."""
-        mock_settings = mocker.Mock()
-        mock_settings.get.return_value = "~/Downloads"
-
-        mock_tk = mocker.patch("src.ui.settings_window.tk")
-        mocker.patch("src.ui.settings_window.ttk")
+        mock_settings = _settings_double()
 
-        SettingsWindow(mock_settings, ["voice1"])
+        SettingsWindow(mock_settings, ["voice1"]).show()
 
         # Should create at least 2 buttons (Browse, Save, Cancel)
-        assert mock_tk.Button.call_count >= 3
+        assert self.tk.Button.call_count >= 3
 
-    def test_show_displays_window(self, mocker):
+    def test_show_displays_window(self):
         """Should display the window."""
-        mock_settings = mocker.Mock()
-        mock_settings.get.return_value = "test_value"
-
-        mocker.patch("src.ui.settings_window.tk")
-        mocker.patch("src.ui.settings_window.ttk")
+        mock_settings = _settings_double()
 
         window = SettingsWindow(mock_settings, ["voice1"])
         window.show()
@@ -154,22 +169,52 @@ class TestSettingsWindow:
         window._window.deiconify.assert_called_once()
         window._window.focus_force.assert_called_once()
 
-    def test_loads_current_settings(self, mocker):
-        """Should load current settings on init."""
-        mock_settings = mocker.Mock()
-        mock_settings.get.side_effect = lambda key: {
-            "voice": "en_US-amy-low",
-            "speed": 1.5,
-            "output_directory": "~/Music",
-        }[key]
+    def test_speed_change_coalesces_label_updates(self):
+        """Should batch slider events into one label update per idle cycle."""
+        mock_settings = _settings_double()
+
+        window = SettingsWindow(mock_settings, ["voice1"])
+        window.show()
+
+        window._window.after_idle.reset_mock()
+        window._speed_display.set.reset_mock()
+
+        # A drag produces a burst of events; only one idle callback is scheduled
+        window._on_speed_change("1.5")
+        window._on_speed_change("1.75")
+        window._window.after_idle.assert_called_once_with(window._flush_speed)
+
+        # The flush applies the most recent value
+        window._flush_speed()
+        window._speed_display.set.assert_called_once_with("1.75x")
 
-        mocker.patch("src.ui.settings_window.tk")
-        mocker.patch("src.ui.settings_window.ttk")
+    def test_window_built_lazily_on_show(self):
+        """Should not build the window until show() is called."""
+        mock_settings = _settings_double()
+
+        window = SettingsWindow(mock_settings, ["voice1"])
+
+        # No Toplevel created yet
+        self.tk.Toplevel.assert_not_called()
+
+        window.show()
+        self.tk.Toplevel.assert_called_once()
+
+        # Repeated show() reuses the existing window
+        window.show()
+        self.tk.Toplevel.assert_called_once()
+
+    def test_loads_current_settings(self):
+        """Should load current settings on init."""
+        mock_settings = _settings_double(_CFG)
 
         window = SettingsWindow(mock_settings, ["en_US-lessac-medium", "en_US-amy-low"])
+        window.show()
 
-        # Should have called get for each setting (voice, speed, and output_directory)
-        assert mock_settings.get.call_count == 3
+        # Should have read all settings in a single batched call
+        assert mock_settings.get_many.calls == [
+            ((("voice", "speed", "output_directory"),), {})
+        ]
 
         # Check that voice variable was set (appears in call_args_list)
         voice_calls = [call for call in window._voice_var.set.call_args_list]
@@ -1,68 +1,125 @@
 """Tests for TextExtractor class."""
 
+from unittest.mock import Mock
+
 import pytest
-import requests
 
 from src.text_extractor import TextExtractor
 
+# HTML payloads used by the extraction tests; module constants so the
+# module-scoped response fixtures below are built exactly once
+_HTML_BASIC = """
+<html>
+    <body>
+        <h1>Title</h1>
+        <p>This is the main content.</p>
+    </body>
+</html>
+"""
+
+_HTML_NOSCRIPT = """
+<html>
+    <head>
+        <style>body { color: red; }</style>
+    </head>
+    <body>
+        <script>alert('test');</script>
+        <p>Main content</p>
+        <nav>Navigation</nav>
+    </body>
+</html>
+"""
+
+_HTML_WHITESPACE = """
+<html>
+    <body>
+        <p>Line   with    multiple     spaces</p>
+        <p>
+
+
+        Multiple newlines
+
+
+        </p>
+    </body>
+</html>
+"""
+
+
+def _make_response(html):
+    response = Mock()
+    response.status_code = 200
+    response.text = html
+    return response
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    """Single TextExtractor (and requests session) shared across the module."""
+    return TextExtractor()
+
+
+@pytest.fixture(autouse=True)
+def _restore_session_get(extractor):
+    """Undo direct session.get assignments after each test.
+
+    Tests stub the shared extractor's session.get by plain attribute
+    assignment, which skips mock.patch's patcher machinery; this fixture
+    provides the teardown that patch.object would have done.
+    """
+    orig = extractor.session.get
+    yield
+    extractor.session.get = orig
+
+
+@pytest.fixture(scope="module")
+def resp_basic():
+    """Canned 200 response with simple title + paragraph content."""
+    return _make_response(_HTML_BASIC)
+
+
+@pytest.fixture(scope="module")
+def resp_noscript():
+    """Canned 200 response containing script/style/nav noise."""
+    return _make_response(_HTML_NOSCRIPT)
+
+
+@pytest.fixture(scope="module")
+def resp_whitespace():
+    """Canned 200 response with messy whitespace."""
+    return _make_response(_HTML_WHITESPACE)
+
 
 class TestTextExtractor:
     """Test suite for TextExtractor."""
 
-    def test_detect_url_valid(self):
-        """Should identify valid URLs."""
-        extractor = TextExtractor()
-        assert extractor.is_url("https://example.com") is True
-        assert extractor.is_url("http://example.com") is True
-        assert extractor.is_url("https://en.wikipedia.org/wiki/Test") is True
-
-    def test_detect_url_plain_text(self):
-        """Should identify plain text as non-URL."""
-        extractor = TextExtractor()
-        assert extractor.is_url("Hello world") is False
-        assert extractor.is_url("This is plain text") is False
-        assert extractor.is_url("example.com") is False  # No protocol
-
-    def test_extract_from_url_returns_text(self, mocker):
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("https://example.com", True),
+            ("http://example.com", True),
+            ("https://en.wikipedia.org/wiki/Test", True),
+            ("Hello world", False),
+            ("This is plain text", False),
+            ("example.com", False),  # No protocol
+        ],
+    )
+    def test_detect_url(self, extractor, text, expected):
+        """Should identify URLs and plain text correctly."""
+        assert extractor.is_url(text) is expected
+
+    def test_extract_from_url_returns_text(self, extractor, resp_basic):
         """Should fetch and extract text from URL."""
-        mock_response = mocker.Mock()
-        mock_response.status_code = 200
-        mock_response.text = """
-        <html>
-            <body>
-                <h1>Title</h1>
-                <p>This is the main content.</p>
-            </body>
-        </html>
-        """
-
-        extractor = TextExtractor()
-        mocker.patch.object(extractor.session, "get", return_value=mock_response)
+        extractor.session.get = Mock(return_value=resp_basic)
 
         text = extractor.extract("https://example.com")
 
         assert "Title" in text
         assert "This is the main content." in text
 
-    def test_extract_removes_scripts_and_styles(self, mocker):
+    def test_extract_removes_scripts_and_styles(self, extractor, resp_noscript):
         """Should remove non-content elements."""
-        mock_response = mocker.Mock()
-        mock_response.status_code = 200
-        mock_response.text = """
-        <html>
-            <head>
-                <style>body { color: red; }</style>
-            </head>
-            <body>
-                <script>alert('test');</script>
-                <p>Main content</p>
-                <nav>Navigation</nav>
-            </body>
-        </html>
-        """
-
-        extractor = TextExtractor()
-        mocker.patch.object(extractor.session, "get", return_value=mock_response)
+        extractor.session.get = Mock(return_value=resp_noscript)
 
         text = extractor.extract("https://example.com")
 
@@ -70,59 +127,24 @@ class TestTextExtractor:
         assert "alert" not in text
         assert "color: red" not in text
 
-    def test_extract_plain_text_passthrough(self):
+    def test_extract_plain_text_passthrough(self, extractor):
         """Should return plain text unchanged."""
-        extractor = TextExtractor()
         plain_text = "This is plain text to read."
         result = extractor.extract(plain_text)
 
         assert result == plain_text
 
-    def test_extract_url_not_found_raises(self, mocker):
-        """Should raise for 404 responses."""
-        mock_response = mocker.Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
-
-        extractor = TextExtractor()
-        mocker.patch.object(extractor.session, "get", return_value=mock_response)
+    @pytest.mark.parametrize("exc", [TextExtractor.HTTPError, TextExtractor.Timeout])
+    def test_extract_request_error_raises(self, extractor, exc):
+        """Should propagate HTTP and timeout errors."""
+        extractor.session.get = Mock(side_effect=exc("request failed"))
 
-        with pytest.raises(requests.HTTPError):
-            extractor.extract("https://example.com/notfound")
-
-    def test_extract_timeout_raises(self, mocker):
-        """Should raise for timeout."""
-        extractor = TextExtractor()
-        mocker.patch.object(
-            extractor.session,
-            "get",
-            side_effect=requests.Timeout("Connection timeout")
-        )
-
-        with pytest.raises(requests.Timeout):
+        with pytest.raises(exc):
             extractor.extract("https://example.com")
 
-    def test_extract_cleans_whitespace(self, mocker):
+    def test_extract_cleans_whitespace(self, extractor, resp_whitespace):
         """Should normalize excessive whitespace."""
-        mock_response = mocker.Mock()
-        mock_response.status_code = 200
-        mock_response.text = """
-        <html>
-            <body>
-                <p>Line   with    multiple     spaces</p>
-                <p>
-
-
-                Multiple newlines
-
-
-                </p>
-            </body>
-        </html>
-        """
-
-        extractor = TextExtractor()
-        mocker.patch.object(extractor.session, "get", return_value=mock_response)
+        extractor.session.get = Mock(return_value=resp_whitespace)
 
         text = extractor.extract("https://example.com")
 
@@ -1,77 +1,71 @@
 """Tests for TrayApplication class."""
 
+from unittest.mock import Mock, patch
+
+import pytest
 
 from src.tray import TrayApplication
 
 
-class TestTrayApplication:
-    """Test suite for TrayApplication."""
+@pytest.fixture
+def tray_icon(monkeypatch):
+    """Patched pystray icon instance handed to TrayApplication.
 
-    def test_menu_has_required_items(self, mocker):
-        """Should have Read Text, settings, quit."""
-        mock_icon = mocker.patch("src.tray.pystray.Icon")
+    monkeypatch.setattr swaps the attribute directly — no patcher
+    start/stop machinery — and a fresh Mock per test keeps call records
+    isolated (copies of a template Mock would share them).
+    """
+    icon = Mock()
+    monkeypatch.setattr("src.tray.pystray.Icon", Mock(return_value=icon))
+    monkeypatch.setattr("src.tray.pystray.Menu", Mock())
+    return icon
 
+
+@pytest.fixture(scope="class")
+def tray_menu():
+    """Menu handed to the pystray icon, built once per class.
+
+    Menu construction is static, so structure tests can introspect a
+    shared instance instead of constructing TrayApplication each time.
+    """
+    with patch("src.tray.pystray.Icon") as mock_icon:
         TrayApplication()
 
-        # Get the menu passed to Icon constructor
-        icon_call_kwargs = mock_icon.call_args[1]
-        menu = icon_call_kwargs["menu"]
+    # Get the menu passed to Icon constructor
+    return mock_icon.call_args[1]["menu"]
+
 
-        # Menu should have items
-        menu_items = menu._items
+class TestTrayMenuStructure:
+    """Static menu structure assertions sharing one TrayApplication."""
 
+    def test_menu_has_required_items(self, tray_menu):
+        """Should have Read Text, settings, quit."""
         # Should have menu items for:
         # - Read Text
         # - Separator
         # - Settings
         # - Quit
-        assert len(menu_items) == 4
-
-
-    def test_tray_app_initializes(self, mocker):
-        """Should initialize tray app correctly."""
-        mocker.patch("src.tray.pystray.Icon")
-        mocker.patch("src.tray.pystray.Menu")
+        assert len(tray_menu._items) == 4
 
-        app = TrayApplication()
-
-        # Verify tray app is initialized
-        assert app._icon is not None
 
+class TestTrayApplication:
+    """Test suite for TrayApplication."""
 
-    def test_run_starts_icon(self, mocker):
-        """Should start the pystray icon."""
-        mock_icon_instance = mocker.Mock()
-        mocker.patch("src.tray.pystray.Icon", return_value=mock_icon_instance)
-        mocker.patch("src.tray.pystray.Menu")
-
-        app = TrayApplication()
-        app.run()
-
-        # Should call icon.run()
-        mock_icon_instance.run.assert_called_once()
-
-    def test_quit_stops_icon(self, mocker):
-        """Should stop the icon when quit is called."""
-        mock_icon_instance = mocker.Mock()
-        mocker.patch("src.tray.pystray.Icon", return_value=mock_icon_instance)
-        mocker.patch("src.tray.pystray.Menu")
-
+    @pytest.mark.parametrize(
+        "action,check",
+        [
+            (lambda app: None, lambda icon: icon.stop.assert_not_called()),
+            (lambda app: app.run(), lambda icon: icon.run.assert_called_once()),
+            (lambda app: app._quit(None, None), lambda icon: icon.stop.assert_called_once()),
+        ],
+        ids=["initial", "run", "quit"],
+    )
+    def test_lifecycle(self, tray_icon, action, check):
+        """Should initialize the icon and start/stop it on run and quit."""
         app = TrayApplication()
-        app._icon = mock_icon_instance
-
-        app._quit(None, None)
-
-        # Should call icon.stop()
-        mock_icon_instance.stop.assert_called_once()
 
+        action(app)
 
-    def test_initial_state(self, mocker):
-        """Should initialize with correct default state."""
-        mocker.patch("src.tray.pystray.Icon")
-        mocker.patch("src.tray.pystray.Menu")
-
-        app = TrayApplication()
-
-        # Should initialize with icon
+        # Icon is always initialized; the action-specific check follows
         assert app._icon is not None
+        check(tray_icon)
@@ -1,46 +1,91 @@
 """Tests for TTS Engine"""
 
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
 import pytest
 
 from src.tts_engine import PiperTTSEngine, TTSError
 
 
+@pytest.fixture(scope="session")
+def short_chunk():
+    """Tiny canned AudioChunk double, built once for the session.
+
+    Tests only read audio_int16_array, so a bare namespace is enough and
+    sharing one instance is safe.
+    """
+    return SimpleNamespace(audio_int16_array=np.array([1, 2, 3, 4, 5], dtype=np.int16))
+
+
+@pytest.fixture(scope="session")
+def long_chunk():
+    """Canned silent AudioChunk double for speed-adjustment tests.
+
+    256 samples is plenty to compare resampled lengths; a full two
+    seconds of audio only made the resampling slower.
+    """
+    return SimpleNamespace(audio_int16_array=np.zeros(256, dtype=np.int16))
+
+
+@pytest.fixture(scope="module")
+def engine(temp_voices_dir, mock_voice_file):
+    """One engine over the shared voices dir for the whole module.
+
+    Construction is pure (no voice loaded); the autouse reset below wipes
+    the loaded-voice state tests leave behind.
+    """
+    return PiperTTSEngine(voices_dir=temp_voices_dir)
+
+
 class TestPiperTTSEngine:
-    def test_discover_voices_returns_list(self, temp_voices_dir, mock_voice_file):
+    @pytest.fixture(autouse=True)
+    def _reset_engine_voice(self, engine):
+        """Return the shared engine to its unloaded state after each test."""
+        yield
+        engine._voice = None
+        engine._current_voice_name = None
+        engine._sample_rate = 22050
+
+    @pytest.fixture(autouse=True)
+    def _patch_piper_load(self):
+        """Patch PiperVoice.load for every test so loading never touches disk.
+
+        Tests that never reach load_voice are unaffected; the missing-file
+        test still raises because the path check runs before the load.
+        """
+        with patch("piper.PiperVoice.load"):
+            yield
+
+    def test_discover_voices_returns_list(self, engine):
         """Should return list of available voice models"""
-        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
         voices = engine.discover_voices()
 
         assert isinstance(voices, list)
         assert len(voices) > 0
         assert "en_US-test-medium" in voices
 
-    def test_discover_voices_empty_directory(self, temp_voices_dir):
+    def test_discover_voices_empty_directory(self, tmp_path):
         """Should return empty list when no voices installed"""
-        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
+        # Session-wide temp_voices_dir may hold the mock voice; use a fresh dir
+        engine = PiperTTSEngine(voices_dir=tmp_path)
         voices = engine.discover_voices()
 
         assert isinstance(voices, list)
         assert len(voices) == 0
 
-    def test_synthesize_returns_audio_data(self, temp_voices_dir, mock_voice_file, mocker):
+    def test_synthesize_returns_audio_data(self, engine, short_chunk):
         """Should return numpy array of audio samples"""
-        import numpy as np
-
-        # Mock AudioChunk
-        mock_chunk = mocker.MagicMock()
-        mock_chunk.audio_int16_array = np.array([1, 2, 3, 4, 5], dtype=np.int16)
-
         # Mock piper-tts synthesis to return audio chunks
         def mock_synthesize(text):
-            return [mock_chunk]
+            return [short_chunk]
 
-        mocker.patch("piper.PiperVoice.load")
-        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
         engine.load_voice("en_US-test-medium")
 
-        # Mock the synthesize method
-        mocker.patch.object(engine._voice, "synthesize", side_effect=mock_synthesize)
+        # _voice is already a Mock from the load patch; plain assignment
+        # skips patch.object's context setup and is discarded on reset
+        engine._voice.synthesize = Mock(side_effect=mock_synthesize)
 
         audio_data, sample_rate = engine.synthesize("Hello world")
 
@@ -49,24 +94,17 @@ class TestPiperTTSEngine:
         assert isinstance(audio_data, np.ndarray)
         assert sample_rate == 22050
 
-    def test_synthesize_with_speed_adjustment(self, temp_voices_dir, mock_voice_file, mocker):
+    def test_synthesize_with_speed_adjustment(self, engine, long_chunk):
         """Should adjust audio speed correctly"""
-        import numpy as np
-
-        # Mock AudioChunk with enough samples to test speed adjustment
-        mock_chunk = mocker.MagicMock()
-        mock_chunk.audio_int16_array = np.zeros(44100, dtype=np.int16)  # 2 seconds at 22050 Hz
-
         # Mock piper-tts synthesis to return audio chunks
         def mock_synthesize(text):
-            return [mock_chunk]
+            return [long_chunk]
 
-        mocker.patch("piper.PiperVoice.load")
-        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
         engine.load_voice("en_US-test-medium")
 
-        # Mock the synthesize method
-        mocker.patch.object(engine._voice, "synthesize", side_effect=mock_synthesize)
+        # _voice is already a Mock from the load patch; plain assignment
+        # skips patch.object's context setup and is discarded on reset
+        engine._voice.synthesize = Mock(side_effect=mock_synthesize)
 
         # Test different speeds
         audio_normal, _ = engine.synthesize("Hello", speed=1.0)
@@ -75,10 +113,8 @@ class TestPiperTTSEngine:
         # Faster speed should produce shorter audio
         assert len(audio_fast) < len(audio_normal)
 
-    def test_synthesize_empty_text_raises(self, temp_voices_dir, mock_voice_file, mocker):
+    def test_synthesize_empty_text_raises(self, engine):
         """Should raise ValueError for empty text"""
-        mocker.patch("piper.PiperVoice.load")
-        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
         engine.load_voice("en_US-test-medium")
 
         with pytest.raises(ValueError, match="Text cannot be empty"):
@@ -87,25 +123,18 @@ class TestPiperTTSEngine:
         with pytest.raises(ValueError, match="Text cannot be empty"):
             engine.synthesize("   ")
 
-    def test_synthesize_missing_voice_raises(self, temp_voices_dir):
+    def test_synthesize_missing_voice_raises(self, engine):
         """Should raise TTSError when no voice is loaded"""
-        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
-
         with pytest.raises(TTSError, match="No voice loaded"):
             engine.synthesize("Hello world")
 
-    def test_load_voice_missing_file_raises(self, temp_voices_dir):
+    def test_load_voice_missing_file_raises(self, engine):
         """Should raise FileNotFoundError for missing voice"""
-        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
-
         with pytest.raises(FileNotFoundError, match="Voice file not found"):
             engine.load_voice("nonexistent-voice")
 
-    def test_get_current_voice(self, temp_voices_dir, mock_voice_file, mocker):
+    def test_get_current_voice(self, engine):
         """Should return currently loaded voice name"""
-        mocker.patch("piper.PiperVoice.load")
-        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
-
         assert engine.current_voice is None
 
         engine.load_voice("en_US-test-medium")